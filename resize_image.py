@@ -1,7 +1,10 @@
 import torch
 import math
+from functools import lru_cache
 from comfy.utils import common_upscale
 
+from .resolution_matrix import ASPECT_RATIOS, DIVISORS, MP_BASE, _ALL_RESOLUTIONS, _parse_resolution
+
 try:
     import comfy.model_management as model_management
     COMFY_AVAILABLE = True
@@ -10,6 +13,210 @@ except ImportError:
 
 MAX_RESOLUTION = 8192
 
+# Input size (B * H * W) from which CPU images are moved to the GPU for resizing
+GPU_RESIZE_MIN_PIXELS = 2_000_000
+
+# Images resized per common_upscale call when tracking progress on large batches
+BATCH_CHUNK_SIZE = 16
+
+# Interpolation modes used for uint8 images, which have native AVX2 kernels
+UINT8_RESIZE_MODES = {
+    "bilinear": "bilinear",
+    "bicubic": "bicubic",
+    "lanczos": "bicubic",
+}
+
+# Placement of the crop/pad position within the spare space, as
+# (num_x, den_x, num_y, den_y): the offset is spare * num // den
+ALIGNMENTS = {
+    "center": (1, 2, 1, 2),
+    "top": (1, 2, 0, 1),
+    "bottom": (1, 2, 1, 1),
+    "left": (0, 1, 1, 2),
+    "right": (1, 1, 1, 2),
+}
+
+
+def _align_offsets(spare_x, spare_y, position):
+    """Return the (x, y) offset that places content at position within the spare pixels."""
+    num_x, den_x, num_y, den_y = ALIGNMENTS[position]
+    return spare_x * num_x // den_x, spare_y * num_y // den_y
+
+
+@lru_cache(maxsize=64)
+def _parse_pad_color(pad_color):
+    """Parse an "R, G, B" string into 0-1 floats, falling back to black.
+
+    Cached, as workflows reuse a handful of pad_color strings on every run.
+    """
+    try:
+        pad_rgb = tuple(int(x.strip()) / 255.0 for x in pad_color.split(","))
+        if len(pad_rgb) != 3:
+            pad_rgb = (0.0, 0.0, 0.0)
+    except (AttributeError, ValueError):
+        pad_rgb = (0.0, 0.0, 0.0)
+    return pad_rgb
+
+
+def _compute_pad_offsets(content_width, content_height, target_width, target_height, position):
+    """Return (left, right, top, bottom) padding placing the content at position in the target."""
+    spare_x = target_width - content_width
+    spare_y = target_height - content_height
+    left, top = _align_offsets(spare_x, spare_y, position)
+    return left, spare_x - left, top, spare_y - top
+
+
+def _compute_crop_box(width, height, target_width, target_height, position):
+    """Return the (x, y, crop_w, crop_h) box matching the target aspect ratio at position."""
+    old_aspect = width / height
+    new_aspect = target_width / target_height
+    
+    if old_aspect > new_aspect:
+        crop_w = round(height * new_aspect)
+        crop_h = height
+    else:
+        crop_w = width
+        crop_h = round(width / new_aspect)
+    
+    x, y = _align_offsets(width - crop_w, height - crop_h, position)
+    return x, y, crop_w, crop_h
+
+
+def _compute_layout(W, H, target_width, target_height, keep_proportion, crop_position):
+    """Resolve the crop box, resize size and padding for a keep_proportion mode.
+
+    Returns (crop_box, width, height, (pad_left, pad_right, pad_top, pad_bottom))
+    where crop_box is None or (x, y, crop_w, crop_h) in input pixels, and
+    width/height is the size the (cropped) image is resized to before padding.
+    """
+    crop_box = None
+    pads = (0, 0, 0, 0)
+    width = target_width
+    height = target_height
+    
+    if keep_proportion in ["resize", "pad", "pad_edge"]:
+        # Maintain the aspect ratio of the INPUT image, in integer
+        # arithmetic (round half up) to avoid float drift
+        if target_width * H <= target_height * W:
+            width = target_width
+            height = (H * target_width + W // 2) // W
+        else:
+            width = (W * target_height + H // 2) // H
+            height = target_height
+        
+        if keep_proportion != "resize":
+            pads = _compute_pad_offsets(width, height, target_width, target_height, crop_position)
+    elif keep_proportion == "crop":
+        # Crop to the target aspect ratio, then resize to the target
+        crop_box = _compute_crop_box(W, H, target_width, target_height, crop_position)
+    
+    return crop_box, width, height, pads
+
+
+def _lanczos_taps(in_size, out_size, a=3):
+    """Return the (indices, weights) taps resampling in_size samples to out_size.
+
+    Both are (out_size, taps) tensors following PIL's antialiased lanczos
+    filter, with taps = 2 * ceil(a * scale) + 1.
+    """
+    scale = in_size / out_size
+    filterscale = max(scale, 1.0)
+    support = a * filterscale
+    taps = math.ceil(support) * 2 + 1
+    
+    center = (torch.arange(out_size, dtype=torch.float64) + 0.5) * scale
+    first = torch.floor(center - support + 0.5)
+    last = torch.floor(center + support + 0.5)
+    indices = first[:, None] + torch.arange(taps, dtype=torch.float64)
+    
+    x = (indices - center[:, None] + 0.5) / filterscale
+    weights = torch.sinc(x) * torch.sinc(x / a)
+    valid = (x.abs() < a) & (indices >= 0) & (indices < in_size) & (indices < last[:, None])
+    weights = torch.where(valid, weights, torch.zeros_like(weights))
+    weights /= weights.sum(dim=1, keepdim=True)
+    
+    # Out-of-range taps carry zero weight, so clamping their indices is harmless
+    return indices.clamp(0, in_size - 1).long(), weights.float()
+
+
+@lru_cache(maxsize=16)
+def _lanczos_matrix(in_size, out_size, device):
+    """Return the sparse (out_size, in_size) lanczos resampling matrix on device.
+
+    Only the taps are stored, so the matrix is out_size * taps entries
+    rather than out_size * in_size, and multiplying by it costs one
+    multiply-add per tap. It only depends on the sizes, so it is cached
+    and shared by every image resized to the same target.
+    """
+    indices, weights = _lanczos_taps(in_size, out_size)
+    rows = torch.arange(out_size).repeat_interleave(indices.shape[1])
+    matrix = torch.sparse_coo_tensor(
+        torch.stack((rows, indices.reshape(-1))),
+        weights.reshape(-1),
+        (out_size, in_size),
+        check_invariants=True,
+    )
+    # Coalescing sums the zero-weight duplicates left by clamped indices
+    return matrix.coalesce().to(device)
+
+
+def _lanczos_resample(samples, dim, out_size):
+    """Lanczos-resample NCHW samples along dim to out_size with the cached sparse matrix."""
+    matrix = _lanczos_matrix(samples.shape[dim], out_size, samples.device)
+    
+    # Put the resampled dim first and flatten the rest into columns
+    moved = samples.movedim(dim, 0)
+    rest = moved.shape[1:]
+    columns = moved.reshape(moved.shape[0], -1).float()
+    
+    resampled = torch.sparse.mm(matrix, columns).to(samples.dtype)
+    return resampled.reshape(out_size, *rest).movedim(0, dim)
+
+
+def _upscale(samples, width, height, upscale_method):
+    """Resize NCHW samples, like common_upscale without cropping.
+
+    Float lanczos on a CUDA device runs as a separable sparse-matrix
+    resample with cached weights, on the samples' own device, instead of
+    ComfyUI's per-image PIL round trip through 8-bit images. On the CPU,
+    PIL is faster, and other backends lack solid sparse support, so
+    common_upscale keeps those cases.
+
+    uint8 CPU input takes torch's native antialiased kernels, which have
+    AVX2 uint8 implementations several times faster than the float path.
+    Lanczos maps to bicubic there.
+    """
+    if (upscale_method == "lanczos" and samples.device.type == "cuda"
+            and samples.is_floating_point() and samples.dim() == 4):
+        resampled = samples
+        if width != samples.shape[3]:
+            resampled = _lanczos_resample(resampled, 3, width)
+        if height != samples.shape[2]:
+            resampled = _lanczos_resample(resampled, 2, height)
+        # Lanczos rings past the input range; clip like the 8-bit PIL path did
+        return resampled.clamp(0.0, 1.0)
+    
+    uint8_mode = UINT8_RESIZE_MODES.get(upscale_method)
+    if uint8_mode is not None and samples.dtype == torch.uint8 and samples.device.type == "cpu":
+        return torch.nn.functional.interpolate(
+            samples, size=(height, width), mode=uint8_mode, antialias=True, align_corners=False
+        )
+    return common_upscale(samples, width, height, upscale_method, crop="disabled")
+
+
+def _resize_mask(mask, width, height, upscale_method):
+    """Resize a (B, H, W) mask, substituting antialiased bicubic for lanczos.
+
+    Lanczos only works on 3-channel input, so rather than tripling the mask
+    into RGB and resizing it three times it is resized once with torch's
+    antialiased bicubic, clamped to the [0, 1] range lanczos would have produced.
+    """
+    if upscale_method == "lanczos":
+        return torch.nn.functional.interpolate(
+            mask.unsqueeze(1), size=(height, width), mode="bicubic", antialias=True, align_corners=False
+        ).squeeze(1).clamp_(0.0, 1.0)
+    return common_upscale(mask.unsqueeze(1), width, height, upscale_method, crop="disabled").squeeze(1)
+
 
 class PixelForgeResizeImage:
     """
@@ -17,23 +224,17 @@ class PixelForgeResizeImage:
     Combines resolution selection with advanced resizing options.
     """
     
-    ASPECT_RATIOS = {
-        "1:1": (1, 1),
-        "3:2": (3, 2),
-        "4:3": (4, 3),
-        "16:9": (16, 9),
-        "16:10": (16, 10),
-    }
+    ASPECT_RATIOS = ASPECT_RATIOS
+    
+    MP_BASE = MP_BASE
     
-    MP_BASE = 1024 * 1024
+    # Built once at import; INPUT_TYPES hands out this same list
+    _ALL_RESOLUTIONS = _ALL_RESOLUTIONS
     
     upscale_methods = ["nearest-exact", "bilinear", "area", "bicubic", "lanczos"]
     
     @classmethod
     def INPUT_TYPES(cls):
-        # Build all possible resolutions
-        all_resolutions = cls._build_all_resolutions()
-        
         return {
             "required": {
                 "image": ("IMAGE",),
@@ -47,14 +248,14 @@ class PixelForgeResizeImage:
                     {"default": "square"},
                 ),
                 "divisible_by": (
-                    [16, 32, 64],
+                    list(DIVISORS),
                     {"default": 16},
                 ),
                 "max_megapixels": (
                     ["1 MP", "2 MP", "4 MP", "6 MP", "8 MP", "12 MP", "16 MP"],
                     {"default": "1 MP"},
                 ),
-                "resolution": (all_resolutions, {"default": "1024×1024"}),
+                "resolution": (cls._ALL_RESOLUTIONS, {"default": "1024x1024"}),
                 # KJ Resize v2 parameters
                 "upscale_method": (cls.upscale_methods, {"default": "lanczos"}),
                 "keep_proportion": (
@@ -63,7 +264,7 @@ class PixelForgeResizeImage:
                 ),
                 "pad_color": ("STRING", {"default": "0, 0, 0", "tooltip": "RGB color for padding (e.g., '0, 0, 0' for black)"}),
                 "crop_position": (
-                    ["center", "top", "bottom", "left", "right"],
+                    list(ALIGNMENTS.keys()),
                     {"default": "center"}
                 ),
             },
@@ -86,273 +287,177 @@ Resizes images to selected resolution with advanced options.
 Combines PixelForge resolution selection with KJNodes Resize v2 features.
 """
 
-    @classmethod
-    def _build_all_resolutions(cls):
-        """Generate all possible resolutions across all aspect ratios and settings."""
-        unique_resolutions = set()
-        
-        for aspect_name, (ratio_w, ratio_h) in cls.ASPECT_RATIOS.items():
-            for div in [16, 32, 64]:
-                for max_mp in [1, 2, 4, 6, 8, 12, 16]:
-                    max_pixels = max_mp * cls.MP_BASE
-                    k = div
-                    
-                    while True:
-                        w = ratio_w * k
-                        h = ratio_h * k
-                        total = w * h
-                        
-                        if total > max_pixels:
-                            break
-                        
-                        unique_resolutions.add(f"{w}×{h}")
-                        unique_resolutions.add(f"{h}×{w}")
-                        
-                        k += div
-        
-        sorted_resolutions = sorted(
-            unique_resolutions,
-            key=lambda r: (
-                int(r.split("×")[0]) * int(r.split("×")[1]),
-                int(r.split("×")[0])
-            )
-        )
-        
-        return sorted_resolutions if sorted_resolutions else ["1024×1024"]
-
     def resize(self, image, aspect_ratio, orientation, divisible_by, max_megapixels, resolution, 
                upscale_method, keep_proportion, pad_color, crop_position, mask=None):
         
-        from comfy.utils import ProgressBar
-        
         B, H, W, C = image.shape
         
         # Initialize progress bar for large batches
         pbar = None
         if B >= 100:
+            from comfy.utils import ProgressBar
             pbar = ProgressBar(B)
         
-        # Parse target resolution from PixelForge parameters
-        target_width, target_height = map(int, resolution.split("×"))
+        # Parse target resolution from PixelForge parameters. As in the
+        # selector, the resolution string is authoritative: the JavaScript
+        # filter only offers pairs matching the orientation, so none is swapped
+        target_width, target_height = _parse_resolution(resolution)
         
-        # Apply orientation (handle square, portrait, landscape swapping)
-        if orientation == "portrait" and target_width > target_height:
-            target_width, target_height = target_height, target_width
-        elif orientation == "landscape" and target_width < target_height:
-            target_width, target_height = target_height, target_width
-        # For square (1:1), no swapping needed
+        pad_rgb = _parse_pad_color(pad_color)
         
-        # Parse pad color
-        try:
-            pad_rgb = [int(x.strip()) / 255.0 for x in pad_color.split(",")]
-            if len(pad_rgb) != 3:
-                pad_rgb = [0.0, 0.0, 0.0]
-        except:
-            pad_rgb = [0.0, 0.0, 0.0]
+        # Resolve the whole output layout before touching any pixels
+        crop_box, width, height, pads = _compute_layout(
+            W, H, target_width, target_height, keep_proportion, crop_position
+        )
+        pad_left, pad_right, pad_top, pad_bottom = pads
+        out_width = width + pad_left + pad_right
+        out_height = height + pad_top + pad_bottom
         
-        # Initialize padding variables
-        pad_left = pad_right = pad_top = pad_bottom = 0
+        if crop_box is not None:
+            # Apply crop as a view; the resize below consumes it without a copy
+            x, y, crop_w, crop_h = crop_box
+            image = image.narrow(1, y, crop_h).narrow(2, x, crop_w)
+            if mask is not None:
+                mask = mask.narrow(1, y, crop_h).narrow(2, x, crop_w)
         
-        width = target_width
-        height = target_height
+        # Identity resizes (e.g. stretch to the input size) skip resampling
+        needs_resize = (width, height) != (image.shape[2], image.shape[1])
         
-        # Calculate new dimensions based on keep_proportion mode
-        if keep_proportion in ["resize", "pad", "pad_edge"]:
-            # Calculate dimensions to maintain aspect ratio of INPUT image
-            ratio = min(target_width / W, target_height / H)
-            new_width = round(W * ratio)
-            new_height = round(H * ratio)
-            
-            # Calculate padding if needed
-            if keep_proportion in ["pad", "pad_edge"]:
-                if crop_position == "center":
-                    pad_left = (target_width - new_width) // 2
-                    pad_right = target_width - new_width - pad_left
-                    pad_top = (target_height - new_height) // 2
-                    pad_bottom = target_height - new_height - pad_top
-                elif crop_position == "top":
-                    pad_left = (target_width - new_width) // 2
-                    pad_right = target_width - new_width - pad_left
-                    pad_top = 0
-                    pad_bottom = target_height - new_height
-                elif crop_position == "bottom":
-                    pad_left = (target_width - new_width) // 2
-                    pad_right = target_width - new_width - pad_left
-                    pad_top = target_height - new_height
-                    pad_bottom = 0
-                elif crop_position == "left":
-                    pad_left = 0
-                    pad_right = target_width - new_width
-                    pad_top = (target_height - new_height) // 2
-                    pad_bottom = target_height - new_height - pad_top
-                elif crop_position == "right":
-                    pad_left = target_width - new_width
-                    pad_right = 0
-                    pad_top = (target_height - new_height) // 2
-                    pad_bottom = target_height - new_height - pad_top
-            
-            width = new_width
-            height = new_height
+        # Large CPU batches resize much faster on the GPU; uint8 stays on the
+        # CPU for its AVX2 kernels. Progress-tracked batches move one chunk at
+        # a time and keep their outputs on the CPU, so only a chunk (with
+        # headroom for intermediates) has to fit next to loaded models
+        output_device = image.device
+        resize_device = None
+        if (needs_resize and COMFY_AVAILABLE and image.device.type == "cpu"
+                and image.dtype != torch.uint8 and B * H * W >= GPU_RESIZE_MIN_PIXELS):
+            device = model_management.get_torch_device()
+            resident = min(B, BATCH_CHUNK_SIZE) if pbar is not None else B
+            channels = C + (1 if mask is not None else 0)
+            pixels = image.shape[1] * image.shape[2] + out_width * out_height
+            required = 2 * resident * channels * pixels * image.element_size()
+            if device.type != "cpu" and model_management.get_free_memory(device) >= required:
+                resize_device = device
+                if pbar is None:
+                    image = image.to(device, non_blocking=True)
+                    if mask is not None:
+                        mask = mask.to(device, non_blocking=True)
         
-        # Crop logic
-        if keep_proportion == "crop":
-            old_height = H
-            old_width = W
-            old_aspect = old_width / old_height
-            new_aspect = target_width / target_height
-            
-            if old_aspect > new_aspect:
-                crop_w = round(old_height * new_aspect)
-                crop_h = old_height
-            else:
-                crop_w = old_width
-                crop_h = round(old_width / new_aspect)
-            
-            # Calculate crop position
-            if crop_position == "center":
-                x = (old_width - crop_w) // 2
-                y = (old_height - crop_h) // 2
-            elif crop_position == "top":
-                x = (old_width - crop_w) // 2
-                y = 0
-            elif crop_position == "bottom":
-                x = (old_width - crop_w) // 2
-                y = old_height - crop_h
-            elif crop_position == "left":
-                x = 0
-                y = (old_height - crop_h) // 2
-            elif crop_position == "right":
-                x = old_width - crop_w
-                y = (old_height - crop_h) // 2
+        # Switch to NCHW once. This is always a view: a contiguous NHWC input is
+        # channels_last in NCHW terms, and a cropped input stays a strided view
+        # that the resize reads directly instead of being compacted first
+        samples = image.permute(0, 3, 1, 2)
+        
+        # Padding is known before resizing: color padding gets its canvas up
+        # front, so resized chunks are written straight into its interior
+        needs_padding = (keep_proportion in ["pad", "pad_edge"]) and (pad_left > 0 or pad_right > 0 or pad_top > 0 or pad_bottom > 0)
+        
+        padded_samples = image_interior = None
+        padded_mask = mask_interior = None
+        if needs_padding:
+            if keep_proportion == "pad":
+                # Integer images (uint8) store 0-255 rather than 0-1 values,
+                # clamped so out-of-range pad colors cannot overflow the dtype
+                pad_values = pad_rgb if samples.is_floating_point() else [
+                    min(max(round(c * 255), 0), 255) for c in pad_rgb
+                ]
+                pad_tensor = torch.tensor(pad_values, device=samples.device, dtype=samples.dtype)
+                padded_samples = torch.empty(
+                    (B, C, out_height, out_width),
+                    device=samples.device,
+                    dtype=samples.dtype,
+                    memory_format=torch.channels_last
+                )
+                padded_samples[...] = pad_tensor.view(1, 3, 1, 1)
+                image_interior = padded_samples[:, :, pad_top:pad_top+height, pad_left:pad_left+width]
             
-            # Apply crop
-            image = image[:, y:y+crop_h, x:x+crop_w, :]
             if mask is not None:
-                mask = mask[:, y:y+crop_h, x:x+crop_w]
-            
-            # After crop, resize to target
-            width = target_width
-            height = target_height
-        
+                padded_mask = mask.new_zeros((B, out_height, out_width))
+                mask_interior = padded_mask[:, pad_top:pad_top+height, pad_left:pad_left+width]
         
-        # Process images with progress tracking for large batches
-        if pbar is not None:
-            # Process images one by one for progress tracking
-            resized_images = []
-            resized_masks = []
+        if not needs_resize:
+            resized_samples = samples
+            resized_mask = mask
+            if pbar is not None:
+                pbar.update(B)
+        elif pbar is not None:
+            # Resize large batches in chunks for progress tracking, writing
+            # straight into preallocated outputs instead of concatenating
+            resized_samples = image_interior
+            if resized_samples is None:
+                resized_samples = torch.empty(
+                    (B, C, height, width),
+                    device=samples.device,
+                    dtype=samples.dtype,
+                    memory_format=torch.channels_last
+                )
+            resized_mask = None
+            if mask is not None:
+                resized_mask = mask_interior if mask_interior is not None else mask.new_empty((B, height, width))
             
-            for i in range(B):
-                single_image = image[i:i+1]
-                single_mask = mask[i:i+1] if mask is not None else None
+            for i in range(0, B, BATCH_CHUNK_SIZE):
+                chunk = slice(i, i + BATCH_CHUNK_SIZE)
                 
-                # Resize single image
-                resized_single = common_upscale(
-                    single_image.movedim(-1, 1),
-                    width,
-                    height,
-                    upscale_method,
-                    crop="disabled"
-                ).movedim(1, -1)
-                resized_images.append(resized_single)
+                # Resize image chunk, on the GPU if offloading
+                chunk_samples = samples[chunk]
+                if resize_device is not None:
+                    chunk_samples = chunk_samples.to(resize_device, non_blocking=True)
+                resized_samples[chunk] = _upscale(chunk_samples, width, height, upscale_method)
                 
-                # Resize mask if present
-                if single_mask is not None:
-                    if upscale_method == "lanczos":
-                        resized_single_mask = common_upscale(
-                            single_mask.unsqueeze(1).repeat(1, 3, 1, 1),
-                            width,
-                            height,
-                            upscale_method,
-                            crop="disabled"
-                        ).movedim(1, -1)[:, :, :, 0]
-                    else:
-                        resized_single_mask = common_upscale(
-                            single_mask.unsqueeze(1),
-                            width,
-                            height,
-                            upscale_method,
-                            crop="disabled"
-                        ).squeeze(1)
-                    resized_masks.append(resized_single_mask)
+                # Resize mask chunk if present
+                if resized_mask is not None:
+                    chunk_mask = mask[chunk]
+                    if resize_device is not None:
+                        chunk_mask = chunk_mask.to(resize_device, non_blocking=True)
+                    resized_mask[chunk] = _resize_mask(chunk_mask, width, height, upscale_method)
                 
-                pbar.update(1)
-            
-            resized_image = torch.cat(resized_images, dim=0)
-            resized_mask = torch.cat(resized_masks, dim=0) if resized_masks else None
+                pbar.update(min(BATCH_CHUNK_SIZE, B - i))
         else:
             # Process entire batch at once for small batches
-            resized_image = common_upscale(
-                image.movedim(-1, 1),
-                width,
-                height,
-                upscale_method,
-                crop="disabled"
-            ).movedim(1, -1)
+            resized_samples = _upscale(samples, width, height, upscale_method)
             
             # Resize mask if present
             resized_mask = None
             if mask is not None:
-                if upscale_method == "lanczos":
-                    resized_mask = common_upscale(
-                        mask.unsqueeze(1).repeat(1, 3, 1, 1),
-                        width,
-                        height,
-                        upscale_method,
-                        crop="disabled"
-                    ).movedim(1, -1)[:, :, :, 0]
-                else:
-                    resized_mask = common_upscale(
-                        mask.unsqueeze(1),
-                        width,
-                        height,
-                        upscale_method,
-                        crop="disabled"
-                    ).squeeze(1)
-
+                resized_mask = _resize_mask(mask, width, height, upscale_method)
         
-        # Apply padding if needed
-        if (keep_proportion in ["pad", "pad_edge"]) and (pad_left > 0 or pad_right > 0 or pad_top > 0 or pad_bottom > 0):
-            # Create padded image
+        # Apply padding if needed, still in NCHW
+        if needs_padding:
             if keep_proportion == "pad_edge":
                 # Edge padding (replicate edge pixels)
-                resized_image = torch.nn.functional.pad(
-                    resized_image.permute(0, 3, 1, 2),
+                resized_samples = torch.nn.functional.pad(
+                    resized_samples,
                     (pad_left, pad_right, pad_top, pad_bottom),
                     mode='replicate'
-                ).permute(0, 2, 3, 1)
-            else:
-                # Color padding
-                pad_tensor = torch.tensor(pad_rgb, device=resized_image.device, dtype=resized_image.dtype)
-                padded_image = pad_tensor.view(1, 1, 1, 3).expand(
-                    B,
-                    height + pad_top + pad_bottom,
-                    width + pad_left + pad_right,
-                    C
                 )
-                padded_image[:, pad_top:pad_top+height, pad_left:pad_left+width, :] = resized_image
-                resized_image = padded_image
+            else:
+                # Color padding, unless the chunks already landed in the canvas
+                if resized_samples is not image_interior:
+                    image_interior.copy_(resized_samples)
+                resized_samples = padded_samples
             
             # Pad mask if present
-            if resized_mask is not None:
-                resized_mask = torch.nn.functional.pad(
-                    resized_mask.unsqueeze(1),
-                    (pad_left, pad_right, pad_top, pad_bottom),
-                    mode='constant',
-                    value=0.0
-                ).squeeze(1)
+            if padded_mask is not None:
+                if resized_mask is not mask_interior:
+                    mask_interior.copy_(resized_mask)
+                resized_mask = padded_mask
+        
+        # Back to ComfyUI's NHWC layout, the only permute after resizing. The
+        # interpolate kernels and padded canvases are channels_last, so this is
+        # already contiguous and .contiguous() only copies for the remaining
+        # paths (lanczos passes, strided crop views), before any device transfer
+        resized_image = resized_samples.permute(0, 2, 3, 1).contiguous().to(output_device)
         
-        # Create default mask if none provided
+        # Create default mask if none provided: a zero-stride view of a single
+        # zero rather than B*H*W allocated floats, so it must be treated as read-only
         if resized_mask is None:
-            resized_mask = torch.zeros(
-                (B, resized_image.shape[1], resized_image.shape[2]),
-                device=resized_image.device,
-                dtype=torch.float32
+            resized_mask = torch.zeros((), device=output_device, dtype=torch.float32).expand(
+                B, out_height, out_width
             )
+        else:
+            resized_mask = resized_mask.to(output_device)
         
-        final_width = resized_image.shape[2]
-        final_height = resized_image.shape[1]
-        
-        return (resized_image, final_width, final_height, resized_mask)
+        return (resized_image, out_width, out_height, resized_mask)
 
 
 NODE_CLASS_MAPPINGS = {
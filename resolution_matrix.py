@@ -1,4 +1,130 @@
-import comfy.utils
+import heapq
+import math
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+ASPECT_RATIOS = {
+    "1:1": (1, 1),
+    "3:2": (3, 2),
+    "4:3": (4, 3),
+    "16:9": (16, 9),
+    "16:10": (16, 10),
+}
+
+DIVISORS = (16, 32, 64)
+MEGAPIXEL_LIMITS = (1, 2, 4, 6, 8, 12, 16)
+
+MP_BASE = 1024 * 1024  # 1 MP = 1,048,576 pixels
+
+# Canonical orientation strings returned by the selector, so outputs share
+# storage with every other use of these names instead of echoing the input
+_ORIENTATIONS = {name: sys.intern(name) for name in ("landscape", "portrait", "square")}
+
+
+def _max_multiplier(ratio_w, ratio_h, max_mp):
+    """Largest k with ratio_w * ratio_h * k² <= max_mp megapixels, in closed form."""
+    return math.isqrt(max_mp * MP_BASE // (ratio_w * ratio_h))
+
+
+def _build_base_sweeps():
+    """Return each aspect ratio's landscape resolutions for the smallest divisor and largest MP cap.
+
+    Every other divisor is a multiple of the smallest and every other cap is
+    smaller, so these sweeps contain every (divisor, cap) option. The
+    narrowed per-setting lists are built by the JavaScript filter.
+    """
+    base_div = min(DIVISORS)
+    max_cap = max(MEGAPIXEL_LIMITS)
+    
+    # All sweeps at once: one row of (w, h) per aspect ratio, one column per
+    # k, masked by the largest cap (each row's fitting entries are a prefix)
+    ratios = np.array(list(ASPECT_RATIOS.values()), dtype=np.int64)
+    max_k = max(_max_multiplier(ratio_w, ratio_h, max_cap) for ratio_w, ratio_h in ratios.tolist())
+    k = np.arange(base_div, max_k + 1, base_div, dtype=np.int64)
+    ws = ratios[:, 0:1] * k
+    hs = ratios[:, 1:2] * k
+    fits = ws * hs <= max_cap * MP_BASE
+    
+    return [
+        list(zip(ws[row][fits[row]].tolist(), hs[row][fits[row]].tolist()))
+        for row in range(len(ratios))
+    ]
+
+
+def _build_all_resolutions(sweeps):
+    """Generate all possible resolutions across all aspect ratios and settings.
+
+    Returns a dict mapping each "WxH" option string to its (width, height),
+    in display order.
+    """
+    # Each sweep grows with k, so it is already a stream sorted by total
+    # pixels (and its swapped counterpart too): merge the streams instead of
+    # sorting the union
+    streams = []
+    for pairs in sweeps:
+        streams.append([(w * h, w, h) for w, h in pairs])
+        streams.append([(w * h, h, w) for w, h in pairs])
+    
+    # Equal (total, width) means the same resolution, and duplicates come
+    # out of the merge adjacent, so one comparison with the last entry
+    # dedupes them
+    sorted_resolutions = {}
+    last = None
+    for entry in heapq.merge(*streams):
+        if entry != last:
+            _, w, h = entry
+            sorted_resolutions["%dx%d" % (w, h)] = (w, h)
+            last = entry
+    
+    return sorted_resolutions if sorted_resolutions else {"1024x1024": (1024, 1024)}
+
+
+def _parse_resolution(resolution):
+    """Return (width, height) for a "WxH" resolution string."""
+    size = _RESOLUTION_LOOKUP.get(resolution)
+    if size is None:
+        # Not one of the generated options (e.g. hand-edited workflow, or
+        # one saved before the options switched from "×" to ASCII "x")
+        width, height = resolution.replace("×", "x").split("x")
+        size = (int(width), int(height))
+    return size
+
+
+@lru_cache(maxsize=4096)
+def _forge(aspect_ratio, orientation, resolution):
+    """Compute the selector outputs; pure in its inputs, so results are cached."""
+    ratio_w, ratio_h = ASPECT_RATIOS[aspect_ratio]
+
+    # The resolution string is authoritative: the options list holds both
+    # (w, h) and (h, w), and the JavaScript filter already offers only the
+    # pairs matching the selected orientation, so no swap is applied here
+    width, height = _parse_resolution(resolution)
+
+    # Total megapixels to 4 decimals in integer arithmetic, rounding ties to
+    # even like round() does (w * h / MP_BASE is exact, so ties do occur,
+    # e.g. 320x512 = 0.15625 MP)
+    micro_mp, remainder = divmod(width * height * 10000, MP_BASE)
+    if remainder * 2 > MP_BASE or (remainder * 2 == MP_BASE and micro_mp & 1):
+        micro_mp += 1
+    total_mp = micro_mp / 10000
+
+    return (
+        width,
+        height,
+        ratio_w,
+        ratio_h,
+        _ORIENTATIONS.get(orientation, orientation),
+        total_mp,
+    )
+
+
+# The option lists are static, so build them once at import instead of on
+# every INPUT_TYPES call (ComfyUI calls it on each node refresh).
+_RESOLUTION_LOOKUP = _build_all_resolutions(_build_base_sweeps())
+_ALL_RESOLUTIONS = list(_RESOLUTION_LOOKUP)
+
 
 class PixelForge:
     DESCRIPTION = "A ComfyUI node for selecting mathematically valid image resolutions filtered by aspect ratio, orientation, and megapixel limit."
@@ -9,22 +135,21 @@ class PixelForge:
     filtered by aspect ratio, divisibility, orientation, and megapixel limit.
     """
 
-    ASPECT_RATIOS = {
-        "1:1": (1, 1),
-        "3:2": (3, 2),
-        "4:3": (4, 3),
-        "16:9": (16, 9),
-        "16:10": (16, 10),
-    }
+    # Stateless: ComfyUI instantiates the node per execution, so skip the
+    # per-instance __dict__
+    __slots__ = ()
 
-    MP_BASE = 1024 * 1024  # 1 MP = 1,048,576 pixels
+    ASPECT_RATIOS = ASPECT_RATIOS
+
+    MP_BASE = MP_BASE
+
+    # Built once at import; INPUT_TYPES hands out this same list
+    _ALL_RESOLUTIONS = _ALL_RESOLUTIONS
 
     @classmethod
     def INPUT_TYPES(cls):
-        # Generate ALL possible resolutions across all combinations
+        # ALL possible resolutions across all combinations
         # JavaScript will filter them dynamically based on user selections
-        all_resolutions = cls._build_all_resolutions()
-
         return {
             "required": {
                 "aspect_ratio": (
@@ -32,18 +157,18 @@ class PixelForge:
                     {"default": "1:1"},
                 ),
                 "orientation": (
-                    ["landscape", "portrait", "square"],
+                    list(_ORIENTATIONS),
                     {"default": "square"},
                 ),
                 "divisible_by": (
-                    [16, 32, 64],
+                    list(DIVISORS),
                     {"default": 16},
                 ),
                 "max_megapixels": (
                     ["1 MP", "2 MP", "4 MP", "6 MP", "8 MP", "12 MP", "16 MP"],
                     {"default": "1 MP"},
                 ),
-                "resolution": (all_resolutions, {"default": "1024×1024"}),
+                "resolution": (cls._ALL_RESOLUTIONS, {"default": "1024x1024"}),
             }
         }
 
@@ -67,75 +192,15 @@ class PixelForge:
 
     # ------------------------------------------------------------
 
-    @classmethod
-    def _build_all_resolutions(cls):
-        """Generate all possible resolutions across all aspect ratios and settings."""
-        unique_resolutions = set()
-        
-        # Iterate through all combinations
-        for aspect_name, (ratio_w, ratio_h) in cls.ASPECT_RATIOS.items():
-            for div in [16, 32, 64]:
-                for max_mp in [1, 2, 4, 6, 8, 12, 16]:
-                    max_pixels = max_mp * cls.MP_BASE
-                    k = div
-                    
-                    while True:
-                        w = ratio_w * k
-                        h = ratio_h * k
-                        total = w * h
-                        
-                        if total > max_pixels:
-                            break
-                        
-                        # Add both landscape and portrait orientations
-                        unique_resolutions.add(f"{w}×{h}")
-                        unique_resolutions.add(f"{h}×{w}")
-                        
-                        k += div
-        
-        # Sort by total pixels for better UX
-        sorted_resolutions = sorted(
-            unique_resolutions,
-            key=lambda r: (
-                int(r.split("×")[0]) * int(r.split("×")[1]),  # total pixels
-                int(r.split("×")[0])  # width
-            )
-        )
-        
-        return sorted_resolutions if sorted_resolutions else ["1024×1024"]
-
+    @staticmethod
     def forge(
-        self,
         aspect_ratio,
         orientation,
         divisible_by,
         max_megapixels,
         resolution,
     ):
-        ratio_w, ratio_h = self.ASPECT_RATIOS[aspect_ratio]
-
-        width, height = map(int, resolution.split("×"))
-
-        # Note: Orientation is already handled by the JavaScript selecting
-        # the appropriate dimension order, but we keep this for safety
-        if orientation == "portrait" and width > height:
-            width, height = height, width
-        elif orientation == "landscape" and width < height:
-            width, height = height, width
-
-        total_mp = (width * height) / self.MP_BASE
-
-        pbar = comfy.utils.ProgressBar(1)
-        pbar.update(1)
-
-        return (
-            width,
-            height,
-            ratio_w,
-            ratio_h,
-            orientation,
-            round(total_mp, 4),
-        )
+        return _forge(aspect_ratio, orientation, resolution)
 
 
 NODE_CLASS_MAPPINGS = {
@@ -91,7 +91,7 @@ app.registerExtension({
                     [w, h] = [h, w];
                 }
 
-                resolutions.push(`${w}×${h}`);
+                resolutions.push(`${w}x${h}`);
                 k += div;
             }
 
@@ -104,6 +104,11 @@ app.registerExtension({
             // Update the widget options
             resolutionWidget.options.values = resolutions;
 
+            // Workflows saved before the switch to ASCII "x" store "W×H"
+            if (typeof resolutionWidget.value === "string") {
+                resolutionWidget.value = resolutionWidget.value.replace("×", "x");
+            }
+
             // If current value is not in the new list, pick the first one
             if (!resolutions.includes(resolutionWidget.value)) {
                 console.log("PixelForge: Current value not in list, setting to:", resolutions[0]);